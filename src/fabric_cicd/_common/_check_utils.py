@@ -6,7 +6,9 @@
 import json
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Union
 
 import filetype
 import requests
@@ -15,6 +17,7 @@ from packaging import version
 import fabric_cicd.constants as constants
 from fabric_cicd._common._color import Fore, Style
 from fabric_cicd._common._exceptions import FileTypeError
+from fabric_cicd._common._json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -92,12 +95,12 @@ def check_version() -> None:
         pass
 
 
-def check_file_type(file_path: Path) -> str:
+def check_file_type(file_path: Union[Path, bytes]) -> str:
     """
     Check the type of the provided file.
 
     Args:
-        file_path: The path to the file.
+        file_path: The path to the file, or the file contents if already read.
     """
     try:
         kind = filetype.guess(file_path)
@@ -113,9 +116,11 @@ def check_file_type(file_path: Path) -> str:
     return "text"
 
 
+@lru_cache(maxsize=256)
 def check_regex(regex: str) -> re.Pattern:
     """
     Check if a regex pattern is valid and returns the pattern.
+    Compiled patterns are cached, as the same exclude patterns are checked for every published item.
 
     Args:
         regex: The regex pattern to match.
@@ -139,7 +144,7 @@ def check_valid_json_content(content: str) -> bool:
         bool: True if the content is valid JSON, False otherwise.
     """
     try:
-        json.loads(content)
+        json_loads(content)
         return True
     except json.JSONDecodeError:
         return False
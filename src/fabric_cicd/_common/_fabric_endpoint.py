@@ -7,7 +7,9 @@ import base64
 import datetime
 import json
 import logging
+import threading
 import time
+import weakref
 from typing import Optional
 
 import requests
@@ -15,6 +17,7 @@ from azure.core.credentials import TokenCredential
 from azure.core.exceptions import (
     ClientAuthenticationError,
 )
+from requests.adapters import HTTPAdapter
 
 import fabric_cicd.constants as constants
 from fabric_cicd._common._exceptions import InvokeError, TokenError
@@ -37,8 +40,30 @@ class FabricEndpoint:
         self.aad_token_expiration = None
         self.token_credential = token_credential
         self.requests = requests_module
+        # Shared session so connections are kept alive and reused across requests instead of reconnecting per call.
+        # The session is shared by the worker threads of the endpoint's callers, so keep a connection per request in flight
+        self.session = requests_module.Session()
+        adapter = HTTPAdapter(pool_maxsize=constants.MAX_CONCURRENT_API_REQUESTS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Close the session's connections when the endpoint is garbage collected or at interpreter exit
+        self._session_finalizer = weakref.finalize(self, self.session.close)
+        # Bounds the requests in flight across all threads using this endpoint, including nested thread pools
+        self._request_semaphore = threading.BoundedSemaphore(constants.MAX_CONCURRENT_API_REQUESTS)
         self._refresh_token()
 
+    def __enter__(self) -> "FabricEndpoint":
+        """Returns the endpoint to use as a context manager that closes the session on exit."""
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        """Closes the session on exiting the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the session and its pooled connections. Safe to call more than once."""
+        self._session_finalizer()
+
     def invoke(self, method: str, url: str, body: str = "{}", files: Optional[dict] = None, **kwargs) -> dict:
         """
         Sends an HTTP request to the specified URL with the given method and body.
@@ -64,7 +89,8 @@ class FabricEndpoint:
                 }
                 if files is None:
                     headers["Content-Type"] = "application/json; charset=utf-8"
-                response = self.requests.request(method=method, url=url, headers=headers, json=body, files=files)
+                with self._request_semaphore:
+                    response = self.session.request(method=method, url=url, headers=headers, json=body, files=files)
 
                 iteration_count += 1
 
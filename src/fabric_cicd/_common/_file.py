@@ -7,7 +7,7 @@ import base64
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Union
 
 from fabric_cicd._common._check_utils import check_file_type
 from fabric_cicd._common._exceptions import FileTypeError
@@ -23,6 +23,8 @@ class File:
     file_path: Path
     type: str = field(default="text", init=False)
     contents: str = field(default="", init=False)
+    relative_path: str = field(default="", init=False)
+    is_platform: bool = field(default=False, init=False)
     IMMUTABLE_FIELDS: ClassVar[set] = {"item_path", "file_path"}
 
     def __setattr__(self, key: str, value: any) -> None:
@@ -45,20 +47,32 @@ class File:
 
     def __post_init__(self) -> None:
         """After initializing the object, read the file contents and set the type."""
-        file_type = check_file_type(self.file_path)
+        # Derived from the immutable paths, so computed once rather than on every access
+        self.relative_path = str(self.file_path.relative_to(self.item_path).as_posix())
+        self.is_platform = self.file_path.name.endswith(".platform")
+
+        # Read the file once and detect the type from the contents in memory rather than reopening the file
+        try:
+            raw_contents = self.file_path.read_bytes()
+        except Exception as e:
+            raw_contents = b""
+            msg = (
+                f"Error reading file {self.file_path}.  "
+                f"Please submit this as a bug https://github.com/microsoft/fabric-cicd/issues/new?template=1-bug.yml.md. Exception: {e}"
+            )
+            FileTypeError(msg, logger)
+
+        file_type = check_file_type(raw_contents)
 
         if file_type != "text":
-            try:
-                self.contents = self.file_path.read_bytes()
-            except Exception as e:
-                msg = (
-                    f"Error reading file {self.file_path} as binary.  "
-                    f"Please submit this as a bug https://github.com/microsoft/fabric-cicd/issues/new?template=1-bug.yml.md. Exception: {e}"
-                )
-                FileTypeError(msg, logger)
+            self.contents = raw_contents
         else:
             try:
-                self.contents = self.file_path.read_text(encoding="utf-8")
+                text_contents = raw_contents.decode("utf-8")
+                # Match the universal newline handling of reading the file in text mode
+                if "\r" in text_contents:
+                    text_contents = text_contents.replace("\r\n", "\n").replace("\r", "\n")
+                self.contents = text_contents
             except Exception as e:
                 msg = (
                     f"Error reading file {self.file_path} as text.  "
@@ -74,15 +88,19 @@ class File:
         """Return the file name."""
         return self.file_path.name
 
-    @property
-    def relative_path(self) -> str:
-        """Return the relative path of the file."""
-        return str(self.file_path.relative_to(self.item_path).as_posix())
-
     @property
     def base64_payload(self) -> dict:
         """Return the file contents as a base64 encoded payload."""
-        byte_file = self.contents.encode("utf-8") if self.type == "text" else self.contents
+        return self.get_base64_payload(self.contents)
+
+    def get_base64_payload(self, contents: Union[str, bytes]) -> dict:
+        """
+        Return the given contents as a base64 encoded payload for the file.
+
+        Args:
+            contents: The file contents to encode, which may differ from the stored contents after processing.
+        """
+        byte_file = contents.encode("utf-8") if isinstance(contents, str) else contents
 
         return {
             "path": self.relative_path,
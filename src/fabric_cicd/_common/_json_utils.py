@@ -0,0 +1,31 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Functions to parse JSON, with orjson when it is installed."""
+
+import json
+from typing import Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(content: Union[str, bytes]) -> any:
+    """
+    Parse JSON content, preferring orjson and falling back to the standard library.
+
+    Args:
+        content: The JSON content to parse.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the standard library decide, as it accepts values orjson rejects (e.g. NaN, integers over 64 bits)
+            pass
+    return json.loads(content)
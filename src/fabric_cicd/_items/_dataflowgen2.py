@@ -230,6 +230,8 @@ def replace_source_dataflow_ids(workspace_obj: FabricWorkspace, item_obj: Item,
         item_obj: The item object.
         file_obj: The file object.
     """
+    contents = file_obj.contents
+
     if str(file_obj.file_path).endswith(".pq"):
         # Get source dataflow info from the dependency dictionary
         source_dataflow_info = workspace_obj.dataflow_dependencies.get(item_obj.name, {})
@@ -245,14 +247,12 @@ def replace_source_dataflow_ids(workspace_obj: FabricWorkspace, item_obj: Item,
 
             # Replace the dataflow ID with its logical ID and the workspace ID with the default workspace ID
             if logical_id:
-                file_obj.contents = file_obj.contents.replace(source_dataflow_id, logical_id)
-                file_obj.contents = file_obj.contents.replace(
-                    source_dataflow_workspace_id, constants.DEFAULT_WORKSPACE_ID
-                )
+                contents = contents.replace(source_dataflow_id, logical_id)
+                contents = contents.replace(source_dataflow_workspace_id, constants.DEFAULT_WORKSPACE_ID)
                 logger.debug(
                     f"Replaced dataflow ID '{source_dataflow_id}' with logical ID '{logical_id}' and workspace ID "
                     f"'{source_dataflow_workspace_id}' with default workspace ID '{constants.DEFAULT_WORKSPACE_ID}' "
                     f"in '{item_obj.name}' file"
                 )
 
-    return file_obj.contents
+    return contents
@@ -19,6 +19,5 @@ def publish_eventhouses(fabric_workspace_obj: FabricWorkspace) -> None:
     """
     item_type = "Eventhouse"
 
-    for item_name in fabric_workspace_obj.repository_items.get(item_type, {}):
-        exclude_path = r".*\.children[/\\].*"
-        fabric_workspace_obj._publish_item(item_name=item_name, item_type=item_type, exclude_path=exclude_path)
+    exclude_path = r".*\.children[/\\].*"
+    fabric_workspace_obj._publish_items(item_type=item_type, exclude_path=exclude_path)
@@ -25,10 +25,7 @@ def publish_kqldashboard(fabric_workspace_obj: FabricWorkspace) -> None:
 
     fabric_workspace_obj._refresh_deployed_items()
 
-    for item_name in fabric_workspace_obj.repository_items.get(item_type, {}):
-        fabric_workspace_obj._publish_item(
-            item_name=item_name, item_type=item_type, func_process_file=func_process_file
-        )
+    fabric_workspace_obj._publish_items(item_type=item_type, func_process_file=func_process_file)
 
 
 def func_process_file(workspace_obj: FabricWorkspace, item_obj: Item, file_obj: File) -> str:
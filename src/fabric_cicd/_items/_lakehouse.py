@@ -112,8 +112,7 @@ def process_shortcuts(fabric_workspace_obj: FabricWorkspace, item_obj: Item) ->
 
     if shortcut_file_obj:
         shortcut_file_obj.contents = fabric_workspace_obj._replace_parameters(shortcut_file_obj, item_obj)
-        shortcut_file_obj.contents = fabric_workspace_obj._replace_logical_ids(shortcut_file_obj.contents)
-        shortcut_file_obj.contents = fabric_workspace_obj._replace_workspace_ids(shortcut_file_obj.contents)
+        shortcut_file_obj.contents = fabric_workspace_obj._replace_ids(shortcut_file_obj.contents)
 
         shortcuts = json.loads(shortcut_file_obj.contents) or []
     else:
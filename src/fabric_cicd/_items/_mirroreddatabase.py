@@ -19,5 +19,4 @@ def publish_mirroreddatabase(fabric_workspace_obj: FabricWorkspace) -> None:
     """
     item_type = "MirroredDatabase"
 
-    for item_name in fabric_workspace_obj.repository_items.get(item_type, {}):
-        fabric_workspace_obj._publish_item(item_name=item_name, item_type=item_type)
+    fabric_workspace_obj._publish_items(item_type=item_type)
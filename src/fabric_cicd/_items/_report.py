@@ -23,14 +23,12 @@ def publish_reports(fabric_workspace_obj: FabricWorkspace) -> None:
     """
     item_type = "Report"
 
-    for item_name in fabric_workspace_obj.repository_items.get(item_type, {}):
-        exclude_path = r".*\.pbi[/\\].*"
-        fabric_workspace_obj._publish_item(
-            item_name=item_name,
-            item_type=item_type,
-            exclude_path=exclude_path,
-            func_process_file=func_process_file,
-        )
+    exclude_path = r".*\.pbi[/\\].*"
+    fabric_workspace_obj._publish_items(
+        item_type=item_type,
+        exclude_path=exclude_path,
+        func_process_file=func_process_file,
+    )
 
 
 def func_process_file(workspace_obj: FabricWorkspace, item_obj: Item, file_obj: File) -> str:
@@ -19,9 +19,8 @@ def publish_semanticmodels(fabric_workspace_obj: FabricWorkspace) -> None:
     """
     item_type = "SemanticModel"
 
-    for item_name in fabric_workspace_obj.repository_items.get(item_type, {}):
-        exclude_path = r".*\.pbi[/\\].*"
-        fabric_workspace_obj._publish_item(item_name=item_name, item_type=item_type, exclude_path=exclude_path)
+    exclude_path = r".*\.pbi[/\\].*"
+    fabric_workspace_obj._publish_items(item_type=item_type, exclude_path=exclude_path)
 
     # Use Power BI API to get dataset information
     # https://learn.microsoft.com/en-us/rest/api/power-bi/datasets/get-datasets-in-group
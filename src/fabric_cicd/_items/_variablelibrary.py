@@ -41,7 +41,9 @@ def activate_value_set(fabric_workspace_obj: FabricWorkspace, item_obj: Item) ->
     settings_file_obj = next((file for file in item_obj.item_files if file.name == "settings.json"), None)
 
     if settings_file_obj:
-        settings_dict = json.loads(settings_file_obj.contents)
+        # Apply the same parameter replacements as the published definition, as the File keeps the repository content
+        settings_contents = fabric_workspace_obj._replace_parameters(settings_file_obj, item_obj)
+        settings_dict = json.loads(settings_contents)
         if fabric_workspace_obj.environment in settings_dict["valueSetsOrder"]:
             active_value_set = fabric_workspace_obj.environment
         else:
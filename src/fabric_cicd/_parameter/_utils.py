@@ -21,6 +21,7 @@ from jsonpath_ng.ext import parse
 import fabric_cicd.constants as constants
 from fabric_cicd import FabricWorkspace
 from fabric_cicd._common._exceptions import InputError, ParsingError
+from fabric_cicd._common._json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -337,10 +338,22 @@ def replace_key_value(workspace_obj: FabricWorkspace, param_dict: dict, json_con
     """
     # Try to load the json content to a dictionary
     try:
-        data = json.loads(json_content)
+        data = json_loads(json_content)
     except json.JSONDecodeError as jde:
         raise ValueError(jde) from jde
 
+    return json.dumps(replace_key_value_in_dict(workspace_obj, param_dict, data, env))
+
+
+def replace_key_value_in_dict(workspace_obj: FabricWorkspace, param_dict: dict, data: dict, env: str) -> dict:
+    """A function to replace key values in already parsed JSON content using parameterization. The data is updated in place.
+
+    Args:
+        workspace_obj: The FabricWorkspace object.
+        param_dict: The parameter dictionary.
+        data: The parsed JSON content to be modified.
+        env: The environment variable to be used for replacement.
+    """
     # Extract the jsonpath expression from the find_key attribute of the param_dict
     jsonpath_expr = parse(param_dict["find_key"])
     replace_value = process_environment_key(workspace_obj, param_dict["replace_value"])
@@ -352,7 +365,7 @@ def replace_key_value(workspace_obj: FabricWorkspace, param_dict: dict, json_con
             except Exception as match_e:
                 raise ValueError(match_e) from match_e
 
-    return json.dumps(data)
+    return data
 
 
 def replace_variables_in_parameter_file(raw_file: str) -> str:
@@ -7,6 +7,9 @@ import json
 import logging
 import os
 import re
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -15,14 +18,18 @@ from azure.core.credentials import TokenCredential
 from azure.identity import DefaultAzureCredential
 
 from fabric_cicd import constants
-from fabric_cicd._common._check_utils import check_regex, check_valid_json_content
+from fabric_cicd._common._check_utils import check_regex
 from fabric_cicd._common._exceptions import FailedPublishedItemStatusError, InputError, ParameterFileError, ParsingError
 from fabric_cicd._common._fabric_endpoint import FabricEndpoint
+from fabric_cicd._common._file import File
 from fabric_cicd._common._item import Item
+from fabric_cicd._common._json_utils import json_loads
 from fabric_cicd._common._logging import print_header
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_WS_ID_RE = re.compile(constants.DEFAULT_WORKSPACE_ID_REFERENCE_REGEX)
+
 
 class FabricWorkspace:
     """A class to manage and publish workspace items to the Fabric API."""
@@ -135,6 +142,19 @@ class FabricWorkspace:
         self.deployed_folders = {}
         self.deployed_items = {}
 
+        # Compiled logical ID pattern and logical ID to GUID mapping, built lazily from repository_items
+        self._logical_id_lookup = None
+
+        # Id and path to item lookups per item type, built lazily from repository_items and deployed_items
+        self._item_lookups = {}
+
+        # Parameter entries with resolved filters and section replacements, built lazily from environment_parameter
+        self._parameter_filters = {}
+        self._parameter_entries = {}
+        self._parameter_appliers = None
+        # Guards resolving parameters, which updates the shared parameter dicts, when items are published concurrently
+        self._parameter_lock = threading.Lock()
+
         # Initialize dataflow dependencies dictionary (used in dataflow item processing)
         self.dataflow_dependencies = {}
 
@@ -158,10 +178,50 @@ class FabricWorkspace:
         """Construct the base API URL using constants."""
         return f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/{self.workspace_id}"
 
+    @property
+    def publish_item_name_exclude_regex(self) -> Optional[str]:
+        """Regex string of item names to exclude from publishing."""
+        return self._publish_item_name_exclude_regex
+
+    @publish_item_name_exclude_regex.setter
+    def publish_item_name_exclude_regex(self, regex: Optional[str]) -> None:
+        """Set the item name exclude regex and cache its compiled pattern."""
+        self._publish_item_name_exclude_regex = regex
+        self._publish_item_name_exclude_re = check_regex(regex) if regex else None
+
+    @property
+    def publish_folder_path_exclude_regex(self) -> Optional[str]:
+        """Regex string of folder paths to exclude from publishing."""
+        return self._publish_folder_path_exclude_regex
+
+    @publish_folder_path_exclude_regex.setter
+    def publish_folder_path_exclude_regex(self, regex: Optional[str]) -> None:
+        """Set the folder path exclude regex and cache its compiled pattern."""
+        self._publish_folder_path_exclude_regex = regex
+        self._publish_folder_path_exclude_re = check_regex(regex) if regex else None
+
+    def _list_paged_values(self, url: str) -> list[dict]:
+        """
+        Returns the values of all pages of a Fabric list API, following continuation URIs until the last page.
+
+        Args:
+            url: The URL of the list API.
+        """
+        values = []
+        request_url = url
+
+        while request_url:
+            response = self.endpoint.invoke(method="GET", url=request_url)
+            values.extend(response["body"].get("value", []))
+
+            # The continuation URI is returned in the body of list APIs
+            request_url = response["body"].get("continuationUri") or response.get("header", {}).get("continuationUri")
+
+        return values
+
     def _resolve_workspace_id(self, workspace_name: str) -> str:
         """Resolve workspace ID based on the workspace name given."""
-        response = self.endpoint.invoke(method="GET", url=f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces")
-        for workspace in response["body"]["value"]:
+        for workspace in self._list_paged_values(f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces"):
             if workspace["displayName"] == workspace_name:
                 return workspace["id"]
         msg = f"Workspace ID could not be resolved from workspace name: {workspace_name}."
@@ -169,10 +229,7 @@ class FabricWorkspace:
 
     def _lookup_item_attribute(self, workspace_id: str, item_type: str, item_name: str, attribute_name: str) -> str:
         """Lookup item attribute in the specified workspace based on item type and name."""
-        response = self.endpoint.invoke(
-            method="GET", url=f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/items"
-        )
-        for item in response["body"]["value"]:
+        for item in self._list_paged_values(f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/items"):
             if item["type"] == item_type and item["displayName"] == item_name:
                 item_guid = item["id"]
                 if attribute_name == "id":
@@ -239,6 +296,9 @@ class FabricWorkspace:
         is_valid = parameter_obj._validate_parameter_file()
         if is_valid:
             self.environment_parameter = parameter_obj.environment_parameter
+            self._parameter_filters = {}
+            self._parameter_entries = {}
+            self._parameter_appliers = None
         else:
             msg = "Deployment terminated due to an invalid parameter file"
             raise ParameterFileError(msg, logger)
@@ -246,78 +306,37 @@ class FabricWorkspace:
     def _refresh_repository_items(self) -> None:
         """Refreshes the repository_items dictionary by scanning the repository directory."""
         self.repository_items = {}
+        self._logical_id_lookup = None
+        self._item_lookups = {}
         empty_logical_id_paths = []  # Collect all paths with empty logical IDs
         visited_logical_ids = set()  # Track visited logical IDs to avoid duplicates
 
-        for root, _dirs, files in os.walk(self.repository_directory):
-            directory = Path(root)
-            # valid item directory with .platform file within
-            if ".platform" in files:
-                item_metadata_path = directory / ".platform"
+        # valid item directory with .platform file within
+        item_directories = list(_iter_platform_dirs(self.repository_directory))
 
-                # Print a warning and skip directory if empty
-                if not any(directory.iterdir()):
-                    logger.warning(f"Directory {directory.name} is empty.")
-                    continue
+        # Reading metadata and item files is IO bound, so load items concurrently while preserving walk order
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            loaded_items = list(executor.map(self._load_repository_item, item_directories))
 
-                # Attempt to read metadata file
-                try:
-                    with Path.open(item_metadata_path, encoding="utf-8") as file:
-                        item_metadata = json.load(file)
-                except FileNotFoundError as e:
-                    msg = f"{item_metadata_path} path does not exist in the specified repository. {e}"
-                    ParsingError(msg, logger)
-                except json.JSONDecodeError as e:
-                    msg = f"Error decoding JSON in {item_metadata_path}. {e}"
-                    ParsingError(msg, logger)
-
-                # Ensure required metadata fields are present
-                if "type" not in item_metadata["metadata"] or "displayName" not in item_metadata["metadata"]:
-                    msg = f"displayName & type are required in {item_metadata_path}"
-                    raise ParsingError(msg, logger)
-
-                item_type = item_metadata["metadata"]["type"]
-                item_description = item_metadata["metadata"].get("description", "")
-                item_name = item_metadata["metadata"]["displayName"]
-                item_logical_id = item_metadata["config"]["logicalId"]
-
-                # Check for empty logical ID and collect the path
-                if not item_logical_id or item_logical_id.strip() == "":
-                    empty_logical_id_paths.append(str(item_metadata_path))
-                    continue  # Skip processing this item further
-
-                if item_logical_id not in visited_logical_ids:
-                    visited_logical_ids.add(item_logical_id)
-                else:
-                    msg = f"Duplicate logicalId '{item_logical_id}' found in {item_metadata_path}"
-                    raise FailedPublishedItemStatusError(msg, logger)
-
-                item_path = directory
-                relative_path = f"/{directory.relative_to(self.repository_directory).as_posix()}"
-                relative_parent_path = "/".join(relative_path.split("/")[:-1])
-                if "disable_workspace_folder_publish" not in constants.FEATURE_FLAG:
-                    item_folder_id = self.repository_folders.get(relative_parent_path, "")
-                else:
-                    item_folder_id = ""
-
-                # Get the GUID if the item is already deployed
-                item_guid = self.deployed_items.get(item_type, {}).get(item_name, Item("", "", "", "")).guid
-
-                if item_type not in self.repository_items:
-                    self.repository_items[item_type] = {}
-
-                # Add the item to the repository_items dictionary
-                self.repository_items[item_type][item_name] = Item(
-                    type=item_type,
-                    name=item_name,
-                    description=item_description,
-                    guid=item_guid,
-                    logical_id=item_logical_id,
-                    path=item_path,
-                    folder_id=item_folder_id,
-                )
+        for item in loaded_items:
+            item_metadata_path = item.path / ".platform"
+
+            # Check for empty logical ID and collect the path
+            if not item.logical_id or item.logical_id.strip() == "":
+                empty_logical_id_paths.append(str(item_metadata_path))
+                continue  # Skip processing this item further
 
-                self.repository_items[item_type][item_name].collect_item_files()
+            if item.logical_id not in visited_logical_ids:
+                visited_logical_ids.add(item.logical_id)
+            else:
+                msg = f"Duplicate logicalId '{item.logical_id}' found in {item_metadata_path}"
+                raise FailedPublishedItemStatusError(msg, logger)
+
+            if item.type not in self.repository_items:
+                self.repository_items[item.type] = {}
+
+            # Add the item to the repository_items dictionary
+            self.repository_items[item.type][item.name] = item
 
         # If we found any empty logical IDs, raise an error with all paths
         if empty_logical_id_paths:
@@ -328,43 +347,91 @@ class FabricWorkspace:
                 msg = f"logicalId cannot be empty in the following files:\n  - {paths_list}"
             raise ParsingError(msg, logger)
 
+    def _load_repository_item(self, directory: Path) -> Item:
+        """
+        Reads the .platform metadata of an item directory and returns the item with its files collected.
+
+        Args:
+            directory: The item directory containing the .platform file.
+        """
+        item_metadata_path = directory / ".platform"
+
+        # Attempt to read metadata file
+        try:
+            item_metadata = json_loads(item_metadata_path.read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            msg = f"{item_metadata_path} path does not exist in the specified repository. {e}"
+            ParsingError(msg, logger)
+        except json.JSONDecodeError as e:
+            msg = f"Error decoding JSON in {item_metadata_path}. {e}"
+            ParsingError(msg, logger)
+
+        # Ensure required metadata fields are present
+        if "type" not in item_metadata["metadata"] or "displayName" not in item_metadata["metadata"]:
+            msg = f"displayName & type are required in {item_metadata_path}"
+            raise ParsingError(msg, logger)
+
+        item_type = item_metadata["metadata"]["type"]
+        item_description = item_metadata["metadata"].get("description", "")
+        item_name = item_metadata["metadata"]["displayName"]
+        item_logical_id = item_metadata["config"]["logicalId"]
+
+        relative_path = f"/{directory.relative_to(self.repository_directory).as_posix()}"
+        relative_parent_path = "/".join(relative_path.split("/")[:-1])
+        if "disable_workspace_folder_publish" not in constants.FEATURE_FLAG:
+            item_folder_id = self.repository_folders.get(relative_parent_path, "")
+        else:
+            item_folder_id = ""
+
+        # Get the GUID if the item is already deployed
+        item_guid = self.deployed_items.get(item_type, {}).get(item_name, Item("", "", "", "")).guid
+
+        item = Item(
+            type=item_type,
+            name=item_name,
+            description=item_description,
+            guid=item_guid,
+            logical_id=item_logical_id,
+            path=directory,
+            folder_id=item_folder_id,
+        )
+
+        # Items with an empty logical ID are reported by the caller, so skip reading their files
+        if item_logical_id and item_logical_id.strip() != "":
+            item.collect_item_files()
+
+        return item
+
     def _refresh_deployed_items(self) -> None:
         """Refreshes the deployed_items dictionary by querying the Fabric workspace items API."""
         # Get all items in workspace
-        # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/get-item
-        response = self.endpoint.invoke(method="GET", url=f"{self.base_api_url}/items")
+        # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/list-items
+        deployed_values = self._list_paged_values(f"{self.base_api_url}/items")
 
-        self.deployed_items = {}
-        self.workspace_items = {}
+        # Additional properties require an API call per item, so look them up concurrently
+        with ThreadPoolExecutor(max_workers=constants.MAX_CONCURRENT_API_REQUESTS) as executor:
+            item_attributes = list(executor.map(self._get_deployed_item_attributes, deployed_values))
 
-        for item in response["body"]["value"]:
+        # Build the dictionaries before assigning them, as items published concurrently may read them during a refresh
+        deployed_items = {}
+        workspace_items = {}
+
+        for item, (sql_endpoint, query_service_uri) in zip(deployed_values, item_attributes):
             item_type = item["type"]
             item_description = item["description"]
             item_name = item["displayName"]
             item_guid = item["id"]
             item_folder_id = item.get("folderId", "")
-            sql_endpoint = ""
-            query_service_uri = ""
 
             # Add an empty dictionary if the item type hasn't been added yet
-            if item_type not in self.deployed_items:
-                self.deployed_items[item_type] = {}
+            if item_type not in deployed_items:
+                deployed_items[item_type] = {}
 
-            if item_type not in self.workspace_items:
-                self.workspace_items[item_type] = {}
-
-            # Get additional properties
-            if item_type in ["Lakehouse", "Warehouse"]:
-                sql_endpoint = self._get_item_attribute(
-                    self.workspace_id, item_type, item_guid, item_name, "sqlendpoint"
-                )
-            if item_type in ["Eventhouse"]:
-                query_service_uri = self._get_item_attribute(
-                    self.workspace_id, item_type, item_guid, item_name, "queryserviceuri"
-                )
+            if item_type not in workspace_items:
+                workspace_items[item_type] = {}
 
             # Add item details to the deployed_items dictionary
-            self.deployed_items[item_type][item_name] = Item(
+            deployed_items[item_type][item_name] = Item(
                 type=item_type,
                 name=item_name,
                 description=item_description,
@@ -373,12 +440,84 @@ class FabricWorkspace:
             )
 
             # Add item details to the workspace_items dictionary required for parameterization (public-facing attributes)
-            self.workspace_items[item_type][item_name] = {
+            workspace_items[item_type][item_name] = {
                 "id": item_guid,
                 "sqlendpoint": sql_endpoint,
                 "queryserviceuri": query_service_uri,
             }
 
+        self.deployed_items = deployed_items
+        self.workspace_items = workspace_items
+        self._item_lookups = {}
+
+    def _get_deployed_item_attributes(self, item: dict) -> tuple[str, str]:
+        """
+        Returns the SQL endpoint and query service URI of a deployed item, if applicable to its type.
+
+        Args:
+            item: The item payload returned by the list items API.
+        """
+        item_type = item["type"]
+        sql_endpoint = ""
+        query_service_uri = ""
+
+        if item_type in ["Lakehouse", "Warehouse"]:
+            sql_endpoint = self._get_item_attribute(
+                self.workspace_id, item_type, item["id"], item["displayName"], "sqlendpoint"
+            )
+        if item_type in ["Eventhouse"]:
+            query_service_uri = self._get_item_attribute(
+                self.workspace_id, item_type, item["id"], item["displayName"], "queryserviceuri"
+            )
+
+        return sql_endpoint, query_service_uri
+
+    def _build_logical_id_lookup(self) -> tuple[Optional[re.Pattern], dict[str, str], Optional[re.Pattern]]:
+        """
+        Builds a single alternation regex of all repository logical IDs, their logical ID to GUID mapping and a
+        combined regex matching either a logical ID or a default workspace ID reference.
+        """
+        logical_id_map = {
+            item_details.logical_id: item_details.guid
+            for item_name in self.repository_items.values()
+            for item_details in item_name.values()
+            if item_details.logical_id
+        }
+        # Longest first so a logical ID that is a prefix of another never shadows it
+        logical_id_pattern = "|".join(
+            re.escape(logical_id) for logical_id in sorted(logical_id_map, key=len, reverse=True)
+        )
+        if not logical_id_pattern:
+            return None, logical_id_map, None
+
+        combined_pattern = f"(?P<logical_id>{logical_id_pattern})|(?:{constants.DEFAULT_WORKSPACE_ID_REFERENCE_REGEX})"
+
+        return re.compile(logical_id_pattern), logical_id_map, re.compile(combined_pattern)
+
+    def _get_logical_id_lookup(self) -> tuple[Optional[re.Pattern], dict[str, str], Optional[re.Pattern]]:
+        """Returns the logical ID lookup, building it if the repository items or their GUIDs changed."""
+        # Read once, as another publish thread may reset the lookup in between
+        logical_id_lookup = self._logical_id_lookup
+        if logical_id_lookup is None:
+            logical_id_lookup = self._build_logical_id_lookup()
+            self._logical_id_lookup = logical_id_lookup
+
+        return logical_id_lookup
+
+    def _resolve_logical_id(self, logical_id: str, logical_id_map: dict[str, str]) -> str:
+        """
+        Returns the deployed GUID of the item with the given logical ID.
+
+        Args:
+            logical_id: The logical ID to resolve.
+            logical_id_map: Mapping of logical IDs to deployed GUIDs.
+        """
+        item_guid = logical_id_map[logical_id]
+        if item_guid == "":
+            msg = f"Cannot replace logical ID '{logical_id}' as referenced item is not yet deployed."
+            raise ParsingError(msg, logger)
+        return item_guid
+
     def _replace_logical_ids(self, raw_file: str) -> str:
         """
         Replaces logical IDs with deployed GUIDs in the raw file content.
@@ -386,68 +525,161 @@ class FabricWorkspace:
         Args:
             raw_file: The raw file content where logical IDs need to be replaced.
         """
-        for item_name in self.repository_items.values():
-            for item_details in item_name.values():
-                logical_id = item_details.logical_id
-                item_guid = item_details.guid
+        logical_id_regex, logical_id_map, _ = self._get_logical_id_lookup()
+        if logical_id_regex is None:
+            return raw_file
 
-                if logical_id in raw_file:
-                    if item_guid == "":
-                        msg = f"Cannot replace logical ID '{logical_id}' as referenced item is not yet deployed."
-                        raise ParsingError(msg, logger)
-                    raw_file = raw_file.replace(logical_id, item_guid)
+        return logical_id_regex.sub(lambda match: self._resolve_logical_id(match.group(0), logical_id_map), raw_file)
 
-        return raw_file
+    def _get_parameter_entries(self, param_name: str, item_type: str, item_name: str) -> list[tuple]:
+        """
+        Returns the entries of a parameter that are in scope for the given item, in parameter file order, as
+        (parameter_dict, input_type, input_name, input_path) tuples. Filters are resolved once per parameter
+        and the item_type/item_name filters are checked once per item.
+
+        Args:
+            param_name: The name of the parameter (e.g., find_replace, key_value_replace).
+            item_type: Type of the item (e.g., Notebook, Environment).
+            item_name: Name of the item.
+        """
+        from fabric_cicd._parameter._utils import (
+            check_replacement,
+            extract_parameter_filters,
+            process_environment_key,
+        )
 
-    def _replace_parameters(self, file_obj: object, item_obj: object) -> str:
+        scope_key = (param_name, item_type, item_name)
+        parameter_entries = self._parameter_entries.get(scope_key)
+        if parameter_entries is None:
+            with self._parameter_lock:
+                if param_name not in self._parameter_filters:
+                    parameter_filters = []
+                    for parameter_dict in self.environment_parameter.get(param_name, []):
+                        # Resolve the '_ALL_' environment key up front, as resolving it updates the parameter dict
+                        if isinstance(parameter_dict.get("replace_value"), dict):
+                            process_environment_key(self, parameter_dict["replace_value"])
+                        parameter_filters.append((parameter_dict, *extract_parameter_filters(self, parameter_dict)))
+                    self._parameter_filters[param_name] = parameter_filters
+
+                parameter_entries = [
+                    (parameter_dict, input_type, input_name, input_path)
+                    for parameter_dict, input_type, input_name, input_path in self._parameter_filters[param_name]
+                    if check_replacement(input_type, input_name, None, item_type, item_name, None)
+                ]
+                self._parameter_entries[scope_key] = parameter_entries
+
+        return parameter_entries
+
+    def _get_parameter_appliers(self) -> list[Callable[[str, str, str, Path], str]]:
+        """
+        Returns the replacement for each parameter section present in the parameter file, in application order.
+        The sections are fixed once the parameter file is loaded, so they are resolved once rather than per file.
+        """
+        if self._parameter_appliers is None:
+            section_appliers = {
+                "key_value_replace": self._apply_key_value_replace,
+                "find_replace": self._apply_find_replace,
+            }
+            self._parameter_appliers = [
+                apply_section
+                for param_name, apply_section in section_appliers.items()
+                if param_name in self.environment_parameter
+            ]
+        return self._parameter_appliers
+
+    def _replace_parameters(self, file_obj: object, item_obj: object, raw_file: Optional[str] = None) -> str:
         """
         Replaces values found in parameter file with the chosen environment value. Handles two parameter dictionary structures.
 
         Args:
             file_obj: The File object instance that provides the file content and file path.
             item_obj: The Item object instance that provides the item type and item name.
+            raw_file: The file content to replace values in. Defaults to the content of file_obj.
+        """
+        raw_file = file_obj.contents if raw_file is None else raw_file
+
+        for apply_section in self._get_parameter_appliers():
+            raw_file = apply_section(raw_file, item_obj.type, item_obj.name, file_obj.file_path)
+
+        return raw_file
+
+    def _apply_key_value_replace(self, raw_file: str, item_type: str, item_name: str, file_path: Path) -> str:
+        """
+        Applies the key_value_replace parameters in scope for the file to its JSON content.
+
+        Args:
+            raw_file: The file content to replace values in.
+            item_type: Type of the item the file belongs to.
+            item_name: Name of the item the file belongs to.
+            file_path: Path of the file.
+        """
+        from fabric_cicd._parameter._utils import check_replacement, replace_key_value_in_dict
+
+        json_content = None
+        is_parsed = False
+
+        for parameter_dict, input_type, input_name, input_path in self._get_parameter_entries(
+            "key_value_replace", item_type, item_name
+        ):
+            # Set the match condition from the resolved file filter values
+            filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
+            if not filter_match:
+                continue
+
+            # Parse the file once for all matching parameters, skipping files that are not valid JSON
+            if not is_parsed:
+                try:
+                    json_content = json_loads(raw_file)
+                except json.JSONDecodeError:
+                    break
+                is_parsed = True
+
+            replace_key_value_in_dict(self, parameter_dict, json_content, self.environment)
+
+        # Serialize once after all replacements are applied
+        if is_parsed:
+            raw_file = json.dumps(json_content)
+
+        return raw_file
+
+    def _apply_find_replace(self, raw_file: str, item_type: str, item_name: str, file_path: Path) -> str:
+        """
+        Applies the find_replace parameters in scope for the file to its content.
+
+        Args:
+            raw_file: The file content to replace values in.
+            item_type: Type of the item the file belongs to.
+            item_name: Name of the item the file belongs to.
+            file_path: Path of the file.
         """
         from fabric_cicd._parameter._utils import (
             check_replacement,
             extract_find_value,
-            extract_parameter_filters,
             extract_replace_value,
             process_environment_key,
-            replace_key_value,
         )
 
-        # Parse the file_obj and item_obj
-        raw_file = file_obj.contents
-        item_type = item_obj.type
-        item_name = item_obj.name
-        file_path = file_obj.file_path
-
-        if "key_value_replace" in self.environment_parameter:
-            for parameter_dict in self.environment_parameter.get("key_value_replace"):
-                # Extract the file filter values and set the match condition
-                input_type, input_name, input_path = extract_parameter_filters(self, parameter_dict)
-                filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
-
-                # Perform replacement if condition is met and file contains valid JSON
-                if filter_match and check_valid_json_content(raw_file):
-                    raw_file = replace_key_value(self, parameter_dict, raw_file, self.environment)
-
-        if "find_replace" in self.environment_parameter:
-            for parameter_dict in self.environment_parameter.get("find_replace"):
-                # Extract the file filter values and set the match condition
-                input_type, input_name, input_path = extract_parameter_filters(self, parameter_dict)
-                filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
-
-                # Extract the find_value and replace_value_dict
-                find_value = extract_find_value(parameter_dict, raw_file, filter_match)
-                replace_value_dict = process_environment_key(self, parameter_dict.get("replace_value", {}))
-
-                # Replace any found references with specified environment value if conditions are met
-                if find_value in raw_file and self.environment in replace_value_dict and filter_match:
-                    replace_value = extract_replace_value(self, replace_value_dict[self.environment])
-                    if replace_value:
-                        raw_file = raw_file.replace(find_value, replace_value)
-                        logger.debug(f"Replacing '{find_value}' with '{replace_value}' in {item_name}.{item_type}")
+        for parameter_dict, input_type, input_name, input_path in self._get_parameter_entries(
+            "find_replace", item_type, item_name
+        ):
+            # Skip literal find values absent from the file before any further processing
+            is_regex = parameter_dict.get("is_regex", "").lower() == "true"
+            if not is_regex and parameter_dict.get("find_value") not in raw_file:
+                continue
+
+            # Set the match condition from the resolved file filter values
+            filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
+
+            # Extract the find_value and replace_value_dict
+            find_value = extract_find_value(parameter_dict, raw_file, filter_match)
+            replace_value_dict = process_environment_key(self, parameter_dict.get("replace_value", {}))
+
+            # Replace any found references with specified environment value if conditions are met
+            if find_value in raw_file and self.environment in replace_value_dict and filter_match:
+                replace_value = extract_replace_value(self, replace_value_dict[self.environment])
+                if replace_value:
+                    raw_file = raw_file.replace(find_value, replace_value)
+                    logger.debug(f"Replacing '{find_value}' with '{replace_value}' in {item_name}.{item_type}")
 
         return raw_file
 
@@ -459,16 +691,31 @@ class FabricWorkspace:
         Args:
             raw_file: The raw file content where workspace IDs need to be replaced.
         """
-        # Use re.sub to replace all matches
-        return re.sub(
-            constants.WORKSPACE_ID_REFERENCE_REGEX,
-            lambda match: (
-                match.group(0).replace(constants.DEFAULT_WORKSPACE_ID, self.workspace_id)
-                if match.group(2) == constants.DEFAULT_WORKSPACE_ID
-                else match.group(0)
-            ),
-            raw_file,
-        )
+        # The default workspace ID is part of the precompiled pattern, so a template substitution replaces it
+        # without calling back into Python for every match
+        return _DEFAULT_WS_ID_RE.sub(rf'\g<1>{self.workspace_id}"', raw_file)
+
+    def _replace_ids(self, raw_file: str) -> str:
+        """
+        Replaces logical IDs and workspace ID references in a single pass over the raw file content.
+        Equivalent to _replace_logical_ids followed by _replace_workspace_ids.
+
+        Args:
+            raw_file: The raw file content where logical and workspace IDs need to be replaced.
+        """
+        _, logical_id_map, combined_regex = self._get_logical_id_lookup()
+        if combined_regex is None:
+            return self._replace_workspace_ids(raw_file)
+
+        def _replace(match: re.Match) -> str:
+            logical_id = match.group("logical_id")
+            if logical_id is not None:
+                return self._resolve_logical_id(logical_id, logical_id_map)
+
+            # Default workspace ID reference, the last group holds the text before the default workspace ID
+            return f'{match.group(combined_regex.groups)}{self.workspace_id}"'
+
+        return combined_regex.sub(_replace, raw_file)
 
     def _convert_id_to_name(self, item_type: str, generic_id: str, lookup_type: str) -> str:
         """
@@ -479,14 +726,20 @@ class FabricWorkspace:
             generic_id: Logical id or item guid of the item based on lookup_type.
             lookup_type: Finding references in deployed file or repo file (Deployed or Repository).
         """
-        lookup_dict = self.repository_items if lookup_type == "Repository" else self.deployed_items
+        lookup_key = (lookup_type, item_type)
+        # Read through a local reference, as a concurrent refresh may replace the lookups
+        item_lookups = self._item_lookups
+        if lookup_key not in item_lookups:
+            lookup_dict = self.repository_items if lookup_type == "Repository" else self.deployed_items
+
+            id_to_name = {}
+            for item_details in lookup_dict[item_type].values():
+                lookup_id = item_details.logical_id if lookup_type == "Repository" else item_details.guid
+                id_to_name.setdefault(lookup_id, item_details.name)
+            item_lookups[lookup_key] = id_to_name
 
-        for item_details in lookup_dict[item_type].values():
-            lookup_id = item_details.logical_id if lookup_type == "Repository" else item_details.guid
-            if lookup_id == generic_id:
-                return item_details.name
-        # if not found
-        return None
+        # None if not found
+        return item_lookups[lookup_key].get(generic_id)
 
     def _convert_path_to_id(self, item_type: str, path: str) -> str:
         """
@@ -496,12 +749,16 @@ class FabricWorkspace:
             item_type: Type of the item (e.g., Notebook, Environment).
             path: Full path of the desired item.
         """
-        if item_type in self.repository_items:
-            for item_details in self.repository_items[item_type].values():
-                if item_details.path == Path(path):
-                    return item_details.logical_id
-        # if not found
-        return None
+        lookup_key = ("Path", item_type)
+        item_lookups = self._item_lookups
+        if lookup_key not in item_lookups:
+            path_to_id = {}
+            for item_details in self.repository_items.get(item_type, {}).values():
+                path_to_id.setdefault(item_details.path, item_details.logical_id)
+            item_lookups[lookup_key] = path_to_id
+
+        # None if not found
+        return item_lookups[lookup_key].get(Path(path))
 
     def _publish_item(
         self,
@@ -527,19 +784,16 @@ class FabricWorkspace:
         api_response = None
 
         # Skip publishing if the item is excluded by the regex
-        if self.publish_item_name_exclude_regex:
-            regex_pattern = check_regex(self.publish_item_name_exclude_regex)
-            if regex_pattern.match(item_name):
-                item.skip_publish = True
-                logger.info(f"Skipping publishing of {item_type} '{item_name}' due to exclusion regex.")
-                return
+        if self._publish_item_name_exclude_re and self._publish_item_name_exclude_re.match(item_name):
+            item.skip_publish = True
+            logger.info(f"Skipping publishing of {item_type} '{item_name}' due to exclusion regex.")
+            return
 
         # Skip publishing if the item's folder path is excluded by the regex
-        if self.publish_folder_path_exclude_regex:
-            regex_pattern = check_regex(self.publish_folder_path_exclude_regex)
+        if self._publish_folder_path_exclude_re:
             relative_path = item.path.relative_to(Path(self.repository_directory))
             relative_path_str = relative_path.as_posix()
-            if regex_pattern.search(relative_path_str):
+            if self._publish_folder_path_exclude_re.search(relative_path_str):
                 item.skip_publish = True
                 logger.info(f"Skipping publishing of {item_type} '{item_name}' due to folder path exclusion regex.")
                 return
@@ -572,16 +826,13 @@ class FabricWorkspace:
         elif shell_only_publish:
             combined_body = metadata_body
         else:
-            item_payload = []
-            for file in item_files:
-                if not re.match(exclude_path, file.relative_path):
-                    if file.type == "text" and not str(file.file_path).endswith(".platform"):
-                        file.contents = func_process_file(self, item, file) if func_process_file else file.contents
-                        file.contents = self._replace_logical_ids(file.contents)
-                        file.contents = self._replace_parameters(file, item)
-                        file.contents = self._replace_workspace_ids(file.contents)
-
-                    item_payload.append(file.base64_payload)
+            # Compile once per item rather than once per file
+            exclude_re = check_regex(exclude_path)
+            item_payload = [
+                self._process_file_payload(item, file, func_process_file)
+                for file in item_files
+                if not exclude_re.match(file.relative_path)
+            ]
 
             definition_body = {"definition": {"parts": item_payload}}
             combined_body = {**metadata_body, **definition_body}
@@ -601,6 +852,8 @@ class FabricWorkspace:
             api_response = item_create_response
             item_guid = item_create_response["body"]["id"]
             self.repository_items[item_type][item_name].guid = item_guid
+            # Newly deployed GUID invalidates the logical ID lookup
+            self._logical_id_lookup = None
 
         elif is_deployed and not shell_only_publish:
             # Update the item's definition if full publish is required
@@ -644,21 +897,91 @@ class FabricWorkspace:
                         # If move is the only operation, use the move response
                         api_response = move_response
                 logger.debug(
-                    f"Moved {item_guid} from folder_id {self.deployed_items[item_type][item_name].folder_id} to folder_id {item.folder_id}"
+                    f"Moved {item_guid} from folder_id {deployed_item.folder_id} to folder_id {item.folder_id}"
                 )
 
         # Store response if responses are being tracked
         if self.responses is not None and api_response:
-            # Initialize item_type dictionary if it doesn't exist
-            if item_type not in self.responses:
-                self.responses[item_type] = {}
-            self.responses[item_type][item_name] = api_response
+            # Initialize item_type dictionary if it doesn't exist, atomically as items may be published concurrently
+            self.responses.setdefault(item_type, {})[item_name] = api_response
 
         # skip_publish_logging provided in kwargs to suppress logging if further processing is to be done
         if not kwargs.get("skip_publish_logging", False):
-            logger.info(f"{constants.INDENT}Published")
+            # Name the item, as items published concurrently log interleaved
+            logger.info(f"{constants.INDENT}Published {item_type} '{item_name}'")
         return
 
+    def _publish_items(self, item_type: str, **kwargs) -> None:
+        """
+        Publishes all repository items of the given type, concurrently if the 'enable_experimental_features' and
+        'enable_parallel_publish' feature flags are set. Only for item types whose items don't reference each other
+        and need no post publish actions.
+
+        Args:
+            item_type: Type of the items to publish (e.g., Notebook, Report).
+            **kwargs: Additional keyword arguments passed to _publish_item for every item.
+        """
+        item_names = list(self.repository_items.get(item_type, {}))
+
+        if (
+            "enable_experimental_features" not in constants.FEATURE_FLAG
+            or "enable_parallel_publish" not in constants.FEATURE_FLAG
+        ):
+            for item_name in item_names:
+                self._publish_item(item_name=item_name, item_type=item_type, **kwargs)
+            return
+
+        publish_failed = threading.Event()
+
+        def _publish(item_name: str) -> None:
+            # Like the serial publish, don't start publishing further items once an item has failed
+            if publish_failed.is_set():
+                return
+            try:
+                self._publish_item(item_name=item_name, item_type=item_type, **kwargs)
+            except Exception:
+                publish_failed.set()
+                raise
+
+        # Publishing is bound by API latency, so publish a bounded number of items at a time
+        with ThreadPoolExecutor(max_workers=constants.MAX_CONCURRENT_API_REQUESTS) as executor:
+            futures = [executor.submit(_publish, item_name) for item_name in item_names]
+            try:
+                # Raise the first failure in publish order
+                for future in futures:
+                    future.result()
+            except Exception:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+        # A lookup built while other items were still being created may be missing their GUIDs
+        self._logical_id_lookup = None
+
+    def _process_file_payload(self, item: Item, file: File, func_process_file: Optional[callable] = None) -> dict:
+        """
+        Applies custom processing and all replacements to a text file and returns the file's base64 encoded payload.
+        Replacements are chained on a local copy of the contents so the File object is left as read from the repository.
+        Logical and workspace IDs are replaced in a single pass when no parameter section applies.
+
+        Args:
+            item: The item the file belongs to.
+            file: The file to process.
+            func_process_file: Custom function to process file contents. Defaults to None.
+        """
+        if file.type != "text" or file.is_platform:
+            return file.base64_payload
+
+        contents = func_process_file(self, item, file) if func_process_file else file.contents
+        if self._get_parameter_appliers():
+            # Parameters see deployed GUIDs but not the target workspace ID, so the ID passes stay on either side
+            contents = self._replace_logical_ids(contents)
+            contents = self._replace_parameters(file, item, contents)
+            contents = self._replace_workspace_ids(contents)
+        else:
+            contents = self._replace_ids(contents)
+
+        return file.get_base64_payload(contents)
+
     def _unpublish_item(self, item_name: str, item_type: str) -> None:
         """
         Unpublishes an item from the Fabric workspace.
@@ -705,18 +1028,9 @@ class FabricWorkspace:
 
         """
         self.deployed_folders = {}
-        request_url = f"{self.base_api_url}/folders"
-        folders = []
 
-        while request_url:
-            # https://learn.microsoft.com/en-us/rest/api/fabric/core/folders/list-folders
-            response = self.endpoint.invoke(method="GET", url=request_url)
-
-            # Handle cases where the response body is empty
-            folder_response = response["body"].get("value", [])
-            folders.extend(folder for folder in folder_response)
-
-            request_url = response["header"].get("continuationUri", None)
+        # https://learn.microsoft.com/en-us/rest/api/fabric/core/folders/list-folders
+        folders = self._list_paged_values(f"{self.base_api_url}/folders")
 
         # Create a lookup table for folders by their ID
         folder_lookup = {folder["id"]: folder for folder in folders}
@@ -873,3 +1187,37 @@ class FabricWorkspace:
                     logger.warning(f"Failed to unpublish folder {folder_id}.  Raw exception: {e}")
 
         logger.info(f"{constants.INDENT}Unpublished")
+
+
+def _iter_platform_dirs(root: Path) -> Iterator[Path]:
+    """
+    Yields directories containing a .platform file in the same top-down order as os.walk. Uses os.scandir
+    directly so file and directory checks rely on the cached directory entry type instead of extra stat calls.
+
+    Args:
+        root: The directory to scan.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        has_platform_file = False
+        subdirectories = []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Symlinked directories are not followed, matching os.walk
+                        if not entry.is_symlink():
+                            subdirectories.append(entry.path)
+                    elif entry.name == ".platform":
+                        has_platform_file = True
+        except OSError:
+            # Unreadable directories are skipped, matching os.walk
+            continue
+
+        if has_platform_file:
+            yield Path(directory)
+
+        # Push in reverse so subdirectories are visited in scandir order
+        stack.extend(reversed(subdirectories))
@@ -5,7 +5,7 @@ import json
 
 import pytest
 
-from fabric_cicd._common._check_utils import check_file_type, check_valid_json_content
+from fabric_cicd._common._check_utils import check_file_type, check_regex, check_valid_json_content
 
 
 @pytest.fixture
@@ -43,6 +43,15 @@ def test_check_file_type_image(image_file):
     assert check_file_type(image_file) == "image"
 
 
+@pytest.mark.parametrize(
+    ("file_fixture", "expected_type"),
+    [("text_file", "text"), ("binary_file", "binary"), ("image_file", "image")],
+)
+def test_check_file_type_from_contents(request, file_fixture, expected_type):
+    file_path = request.getfixturevalue(file_fixture)
+    assert check_file_type(file_path.read_bytes()) == expected_type
+
+
 @pytest.fixture
 def real_schedules_file(tmp_path):
     """Create a realistic .schedules file with exact structure like fabric-cicd uses."""
@@ -168,3 +177,14 @@ def test_check_valid_json_content_with_schedules_structure():
         "schedules": [{"jobType": "Execute", "enabled": True, "cronExpression": "0 0 12 * * ?"}]
     })
     assert check_valid_json_content(schedules_json) is True
+
+
+def test_check_regex_returns_cached_pattern():
+    pattern = check_regex(r"^cached_.*$")
+    assert pattern.match("cached_item")
+    assert check_regex(r"^cached_.*$") is pattern
+
+
+def test_check_regex_invalid_pattern():
+    with pytest.raises(ValueError, match="An error occurred with the regex provided"):
+        check_regex(r"[unclosed")
@@ -4,7 +4,9 @@
 import base64
 import datetime
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import pytest
@@ -45,7 +47,7 @@ def setup_mocks(monkeypatch, mocker):
     mock_logger.info.side_effect = dl.info
     mock_logger.debug.side_effect = dl.debug
     monkeypatch.setattr("fabric_cicd._common._fabric_endpoint.logger", mock_logger)
-    mock_requests = mocker.patch("requests.request")
+    mock_requests = mocker.patch("requests.Session.request")
     return dl, mock_requests
 
 
@@ -73,6 +75,79 @@ def test_integration(setup_mocks):
     assert response["status_code"] == 200
 
 
+def test_invoke_reuses_session(setup_mocks):
+    """Test that all requests of an endpoint are sent through one shared session."""
+    _, mock_requests = setup_mocks
+    mock_requests.return_value = Mock(
+        status_code=200, headers={"Content-Type": "application/json"}, json=Mock(return_value={})
+    )
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value.token = generate_mock_jwt()
+    endpoint = FabricEndpoint(token_credential=mock_token_credential)
+    session = endpoint.session
+
+    endpoint.invoke("GET", "http://example.com/items")
+    endpoint.invoke("POST", "http://example.com/items")
+
+    assert endpoint.session is session
+    assert mock_requests.call_count == 2
+
+
+def test_session_pool_sized_to_concurrent_requests(setup_mocks, monkeypatch):
+    """Test that the session keeps a pooled connection for every request that may be in flight."""
+    _, _mock_requests = setup_mocks
+    monkeypatch.setattr(constants, "MAX_CONCURRENT_API_REQUESTS", 16)
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value.token = generate_mock_jwt()
+    endpoint = FabricEndpoint(token_credential=mock_token_credential)
+
+    assert endpoint.session.get_adapter("https://api.fabric.microsoft.com")._pool_maxsize == 16
+
+
+def test_close_closes_session(setup_mocks, mocker):
+    """Test that the session is closed once, by close or on exiting the endpoint context."""
+    _, _mock_requests = setup_mocks
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value.token = generate_mock_jwt()
+    mock_close = mocker.patch("requests.Session.close")
+
+    with FabricEndpoint(token_credential=mock_token_credential) as endpoint:
+        mock_close.assert_not_called()
+    mock_close.assert_called_once()
+
+    endpoint.close()
+    mock_close.assert_called_once()
+
+
+def test_invoke_bounds_concurrent_requests(setup_mocks, monkeypatch):
+    """Test that requests sent from many threads never exceed the concurrent request limit."""
+    _, mock_requests = setup_mocks
+    monkeypatch.setattr(constants, "MAX_CONCURRENT_API_REQUESTS", 2)
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def mock_request(**_kwargs):
+        with lock:
+            in_flight.append(None)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.pop()
+        return Mock(status_code=200, headers={"Content-Type": "application/json"}, json=Mock(return_value={}))
+
+    mock_requests.side_effect = mock_request
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value.token = generate_mock_jwt()
+    endpoint = FabricEndpoint(token_credential=mock_token_credential)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda index: endpoint.invoke("GET", f"http://example.com/{index}"), range(24)))
+
+    assert mock_requests.call_count == 24
+    assert max(max_in_flight) == 2
+
+
 def test_performance(setup_mocks):
     """Test that _handle_response completes quickly under long-running simulation."""
     _, _mock_requests = setup_mocks
@@ -34,6 +34,7 @@ def test_file_text_initialization(text_file):
     assert text_file.name == "Table.tmdl"
     assert text_file.contents == SAMPLE_TEXT_DATA
     assert text_file.relative_path == "definition/tables/Table.tmdl"
+    assert text_file.is_platform is False
 
 
 def test_file_text_payload(text_file):
@@ -90,3 +91,24 @@ def test_file_text_special_characters(tmp_path):
         "payload": expected_payload,
         "payloadType": "InlineBase64",
     }
+
+
+def test_file_text_normalizes_line_endings(tmp_path):
+    item_path = tmp_path / "workspace/ABC.Notebook"
+    file_path = item_path / "notebook-content.py"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"line one\r\nline two\rline three\n")
+    file_obj = File(item_path=item_path, file_path=file_path)
+    assert file_obj.type == "text"
+    assert file_obj.contents == file_path.read_text(encoding="utf-8")
+    assert file_obj.contents == "line one\nline two\nline three\n"
+
+
+def test_file_platform_flag(tmp_path):
+    item_path = tmp_path / "workspace/ABC.Notebook"
+    file_path = item_path / ".platform"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text('{"config": {"logicalId": "abc"}}', encoding="utf-8")
+    file_obj = File(item_path=item_path, file_path=file_path)
+    assert file_obj.is_platform is True
+    assert file_obj.relative_path == ".platform"
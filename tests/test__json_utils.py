@@ -0,0 +1,41 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from fabric_cicd._common import _json_utils
+from fabric_cicd._common._json_utils import json_loads
+
+
+@pytest.fixture(params=["orjson", "stdlib"], autouse=True)
+def json_backend(request):
+    """Run each test with and without orjson available."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with patch.object(_json_utils, "orjson", None):
+            yield
+
+
+def test_json_round_trip():
+    data = {"name": "Ö æ ø 你好", "values": [1, 2.5, True, None], "nested": {"key": "value"}}
+    assert json_loads(json.dumps(data)) == data
+
+
+def test_json_loads_accepts_bytes():
+    assert json_loads(b'{"key": "value"}') == {"key": "value"}
+
+
+def test_json_loads_invalid_raises_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_loads('{"key": }')
+
+
+def test_json_falls_back_for_big_integers():
+    big_int = 2**70
+    assert json_loads(f'{{"value": {big_int}}}') == {"value": big_int}
+    assert json_loads(json.dumps({"value": big_int})) == {"value": big_int}
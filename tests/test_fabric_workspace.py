@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import base64
 import json
 import tempfile
 from pathlib import Path
@@ -581,6 +582,316 @@ find_replace:
     assert "ppe-replacement-value" in replaced_content_with_env, "Replacement should occur with matching environment"
 
 
+def test_key_value_replace_parses_file_once(patched_fabric_workspace, temp_workspace_dir, valid_workspace_id):
+    """Test that all matching key_value_replace parameters are applied to a single parse of the file."""
+    parameter_content = """
+key_value_replace:
+    - find_key: $.connection.server
+      replace_value:
+        PPE: "ppe-server"
+    - find_key: $.connection.database
+      replace_value:
+        PPE: "ppe-database"
+    - find_key: $.connection.port
+      replace_value:
+        PPE: 1234
+      item_type: "DataPipeline"
+"""
+    item_dir = temp_workspace_dir / "Test Notebook.Notebook"
+    item_dir.mkdir(parents=True)
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+    (item_dir / "content.json").write_text(
+        json.dumps({"connection": {"server": "dev-server", "database": "dev-database", "port": 1}})
+    )
+
+    from fabric_cicd._common._file import File
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    test_item = Item(type="Notebook", name="Test Notebook", description="", guid="test-guid", path=item_dir)
+    test_file = File(item_path=item_dir, file_path=item_dir / "content.json")
+
+    with patch("fabric_cicd.fabric_workspace.json_loads", wraps=json.loads) as mock_loads:
+        result = json.loads(workspace._replace_parameters(test_file, test_item))
+
+    assert mock_loads.call_count == 1
+    assert result == {"connection": {"server": "ppe-server", "database": "ppe-database", "port": 1}}
+
+
+def test_find_replace_skips_absent_find_values(patched_fabric_workspace, temp_workspace_dir, valid_workspace_id):
+    """Test that find_replace entries whose literal find_value is absent skip further processing."""
+    parameter_content = """
+find_replace:
+    - find_value: "present-value"
+      replace_value:
+        PPE: "ppe-present-value"
+    - find_value: "absent-value"
+      replace_value:
+        PPE: "ppe-absent-value"
+      file_path: "**/*.py"
+"""
+    notebook_dir = temp_workspace_dir / "Test Notebook.Notebook"
+    notebook_dir.mkdir(parents=True)
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+    (notebook_dir / "notebook-content.py").write_text('value = "present-value"')
+
+    from fabric_cicd._common._file import File
+    from fabric_cicd._common._item import Item
+    from fabric_cicd._parameter import _utils
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    test_item = Item(type="Notebook", name="Test Notebook", description="", guid="test-guid", path=notebook_dir)
+    test_file = File(item_path=notebook_dir, file_path=notebook_dir / "notebook-content.py")
+
+    # Resolve the parameter entries first, so only processing during replacement is counted
+    workspace._get_parameter_entries("find_replace", "Notebook", "Test Notebook")
+
+    with patch.object(_utils, "process_environment_key", wraps=_utils.process_environment_key) as mock_process:
+        result = workspace._replace_parameters(test_file, test_item)
+
+    assert result == 'value = "ppe-present-value"'
+    assert mock_process.call_count == 1
+
+
+def test_parameter_entries_resolved_once_per_parameter(
+    patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
+):
+    """Test that parameter filters are resolved once and entries are scoped by item type and name."""
+    parameter_content = """
+find_replace:
+    - find_value: "notebook-value"
+      replace_value:
+        PPE: "ppe-notebook-value"
+      item_type: "Notebook"
+    - find_value: "pipeline-value"
+      replace_value:
+        PPE: "ppe-pipeline-value"
+      item_type: "DataPipeline"
+"""
+    notebook_dir = temp_workspace_dir / "Test Notebook.Notebook"
+    notebook_dir.mkdir(parents=True)
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+
+    from fabric_cicd._parameter import _utils
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    with patch.object(_utils, "extract_parameter_filters", wraps=_utils.extract_parameter_filters) as mock_filters:
+        notebook_entries = workspace._get_parameter_entries("find_replace", "Notebook", "Test Notebook")
+        workspace._get_parameter_entries("find_replace", "Notebook", "Other Notebook")
+        pipeline_entries = workspace._get_parameter_entries("find_replace", "DataPipeline", "Test Pipeline")
+
+    assert mock_filters.call_count == 2
+    assert [entry[0]["find_value"] for entry in notebook_entries] == ["notebook-value"]
+    assert [entry[0]["find_value"] for entry in pipeline_entries] == ["pipeline-value"]
+    assert workspace._get_parameter_entries("key_value_replace", "Notebook", "Test Notebook") == []
+
+
+def test_parameter_appliers_bound_once_per_parameter_file(
+    patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
+):
+    """Test that only the parameter sections in the parameter file are applied, resolved once per load."""
+    parameter_content = """
+find_replace:
+    - find_value: "notebook-value"
+      replace_value:
+        PPE: "ppe-notebook-value"
+"""
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    appliers = workspace._get_parameter_appliers()
+    assert appliers == [workspace._apply_find_replace]
+    assert workspace._get_parameter_appliers() is appliers
+
+    file_obj = MagicMock(contents='value = "notebook-value"', file_path=temp_workspace_dir / "notebook-content.py")
+    item_obj = MagicMock(type="Notebook")
+    item_obj.name = "Test Notebook"
+    with patch.object(workspace, "_apply_key_value_replace") as mock_key_value_replace:
+        assert workspace._replace_parameters(file_obj, item_obj) == 'value = "ppe-notebook-value"'
+    mock_key_value_replace.assert_not_called()
+
+    # Reloading the parameter file rebinds the appliers
+    workspace._refresh_parameter_file()
+    assert workspace._get_parameter_appliers() is not appliers
+
+
+def test_parameter_entries_resolve_all_environment_key(
+    patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
+):
+    """Test that the '_ALL_' environment key is resolved once when the entries are built, not on each use."""
+    parameter_content = """
+find_replace:
+    - find_value: "shared-value"
+      replace_value:
+        _ALL_: "target-value"
+key_value_replace:
+    - find_key: "$.server"
+      replace_value:
+        _all_: "target-server"
+"""
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+
+    from fabric_cicd._parameter import _utils
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    find_replace_entries = workspace._get_parameter_entries("find_replace", "Notebook", "Test Notebook")
+    key_value_entries = workspace._get_parameter_entries("key_value_replace", "Notebook", "Test Notebook")
+
+    assert find_replace_entries[0][0]["replace_value"] == {"PPE": "target-value"}
+    assert key_value_entries[0][0]["replace_value"] == {"PPE": "target-server"}
+
+    # Later processing finds the key already resolved and leaves the shared parameter dict unchanged
+    with patch.object(_utils, "process_environment_key", wraps=_utils.process_environment_key) as mock_process:
+        workspace._get_parameter_entries("find_replace", "Notebook", "Other Notebook")
+    mock_process.assert_not_called()
+    assert _utils.process_environment_key(workspace, find_replace_entries[0][0]["replace_value"]) == {
+        "PPE": "target-value"
+    }
+
+
+def test_iter_platform_dirs_matches_os_walk_order():
+    """Test that the scandir based walker finds the same item directories in the same order as os.walk."""
+    import os
+
+    from fabric_cicd.fabric_workspace import _iter_platform_dirs
+
+    sample_workspace = Path(__file__).parent.parent / "sample" / "workspace"
+    expected = [Path(root) for root, _dirs, files in os.walk(sample_workspace) if ".platform" in files]
+
+    assert expected
+    assert list(_iter_platform_dirs(sample_workspace)) == expected
+
+
+def create_repository_item(dir_path, relative_path, item_type, display_name, logical_id):
+    """Create an item directory with a .platform file and a content file."""
+    item_dir = dir_path / relative_path
+    item_dir.mkdir(parents=True, exist_ok=True)
+    metadata_content = {
+        "metadata": {"type": item_type, "displayName": display_name},
+        "config": {"logicalId": logical_id},
+    }
+    with (item_dir / ".platform").open("w", encoding="utf-8") as f:
+        json.dump(metadata_content, f)
+    with (item_dir / "content.txt").open("w", encoding="utf-8") as f:
+        f.write(f"{display_name} content")
+    return item_dir
+
+
+def test_refresh_repository_items_merges_in_walk_order(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that items loaded concurrently are merged in the order the repository is walked."""
+    from fabric_cicd.fabric_workspace import _iter_platform_dirs
+
+    for index in range(12):
+        folder = ["", "folder_a/", "folder_b/nested/"][index % 3]
+        item_type = ["Notebook", "Environment"][index % 2]
+        create_repository_item(
+            temp_workspace_dir, f"{folder}Item{index}.{item_type}", item_type, f"Item{index}", f"logical-id-{index}"
+        )
+
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Notebook", "Environment"],
+    )
+
+    walk_order = list(_iter_platform_dirs(temp_workspace_dir))
+    walk_types = [path.suffix[1:] for path in walk_order]
+
+    # Item types are added as first seen and items of each type keep the walk order
+    assert list(workspace.repository_items) == list(dict.fromkeys(walk_types))
+    for item_type, items in workspace.repository_items.items():
+        assert [item.path for item in items.values()] == [path for path in walk_order if path.suffix[1:] == item_type]
+        for item in items.values():
+            assert sorted(file.file_path.name for file in item.item_files) == [".platform", "content.txt"]
+
+
+def test_refresh_repository_items_duplicate_logical_id(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that a logical ID used by two items raises an error after concurrent loading."""
+    from fabric_cicd._common._exceptions import FailedPublishedItemStatusError
+
+    create_repository_item(temp_workspace_dir, "First.Notebook", "Notebook", "First", "shared-logical-id")
+    create_repository_item(temp_workspace_dir, "Second.Notebook", "Notebook", "Second", "shared-logical-id")
+
+    with pytest.raises(FailedPublishedItemStatusError, match="Duplicate logicalId 'shared-logical-id'"):
+        patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+
+def test_refresh_repository_items_skips_files_for_empty_logical_id(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that all empty logical IDs are reported and files are only collected for items with a logical ID."""
+    from fabric_cicd._common._exceptions import ParsingError
+    from fabric_cicd._common._item import Item
+
+    valid_dir = create_repository_item(temp_workspace_dir, "Valid.Notebook", "Notebook", "Valid", "valid-logical-id")
+    empty_dir = create_repository_item(temp_workspace_dir, "Empty.Notebook", "Notebook", "Empty", "")
+    blank_dir = create_repository_item(temp_workspace_dir, "Blank.Notebook", "Notebook", "Blank", "   ")
+
+    collected_paths = []
+    original_collect_item_files = Item.collect_item_files
+
+    def _collect_item_files(item):
+        collected_paths.append(item.path)
+        original_collect_item_files(item)
+
+    with (
+        patch.object(Item, "collect_item_files", autospec=True, side_effect=_collect_item_files),
+        pytest.raises(ParsingError, match="logicalId cannot be empty in the following files") as exc_info,
+    ):
+        patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    assert str(empty_dir / ".platform") in str(exc_info.value)
+    assert str(blank_dir / ".platform") in str(exc_info.value)
+    assert collected_paths == [valid_dir]
+
+
 def test_empty_logical_id_validation(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
     """Test that empty logical IDs raise a ParsingError during repository refresh."""
     from fabric_cicd._common._exceptions import ParsingError
@@ -692,6 +1003,188 @@ def test_valid_logical_id_works_correctly(temp_workspace_dir, patched_fabric_wor
     )
 
 
+def test_replace_logical_ids(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test that all referenced logical IDs are replaced and the lookup refreshes when a GUID is assigned."""
+    from fabric_cicd._common._exceptions import ParsingError
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    workspace.repository_items = {
+        "Notebook": {
+            "Deployed": Item("Notebook", "Deployed", "", "deployed-guid", logical_id="logical-id-1"),
+            "Pending": Item("Notebook", "Pending", "", "", logical_id="logical-id-2"),
+        }
+    }
+
+    raw_file = 'ref_a = "logical-id-1"\nref_b = "logical-id-1"\nother = "unrelated"'
+    assert (
+        workspace._replace_logical_ids(raw_file)
+        == 'ref_a = "deployed-guid"\nref_b = "deployed-guid"\nother = "unrelated"'
+    )
+
+    # Referencing an item that is not yet deployed raises an error
+    with pytest.raises(ParsingError, match="logical-id-2"):
+        workspace._replace_logical_ids('ref = "logical-id-2"')
+
+    # Once the referenced item is assigned a GUID the lookup is rebuilt
+    workspace.repository_items["Notebook"]["Pending"].guid = "pending-guid"
+    workspace._logical_id_lookup = None
+    assert workspace._replace_logical_ids('ref = "logical-id-2"') == 'ref = "pending-guid"'
+
+
+def test_replace_ids_matches_sequential_replacement(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test the single pass id replacement matches replacing logical IDs and then workspace IDs."""
+    from fabric_cicd._common._exceptions import ParsingError
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    raw_file = (
+        '{"artifactId": "logical-id-1", "workspaceId": "00000000-0000-0000-0000-000000000000"}\n'
+        'default_lakehouse_workspace_id = "11111111-1111-1111-1111-111111111111"\n'
+        '"workspace": "00000000-0000-0000-0000-000000000000", "ref": "logical-id-1"'
+    )
+
+    # Without repository items only workspace IDs are replaced
+    assert workspace._replace_ids(raw_file) == workspace._replace_workspace_ids(raw_file)
+
+    workspace.repository_items = {
+        "Notebook": {
+            "Deployed": Item("Notebook", "Deployed", "", "deployed-guid", logical_id="logical-id-1"),
+            "Pending": Item("Notebook", "Pending", "", "", logical_id="logical-id-2"),
+        }
+    }
+    workspace._logical_id_lookup = None
+
+    expected = workspace._replace_workspace_ids(workspace._replace_logical_ids(raw_file))
+    assert workspace._replace_ids(raw_file) == expected
+    assert valid_workspace_id in expected
+    assert "logical-id-1" not in expected
+
+    with pytest.raises(ParsingError, match="logical-id-2"):
+        workspace._replace_ids('ref = "logical-id-2"')
+
+
+def test_process_file_payload_leaves_file_unchanged(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test that file payloads carry the replaced content while the File keeps the repository content."""
+    from fabric_cicd._common._file import File
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    item_path = temp_workspace_dir / "Test.Notebook"
+    file_path = item_path / "notebook-content.py"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    original_content = '"workspaceId": "00000000-0000-0000-0000-000000000000"'
+    file_path.write_text(original_content, encoding="utf-8")
+
+    item = Item("Notebook", "Test", "", "", path=item_path)
+    file_obj = File(item_path=item_path, file_path=file_path)
+
+    payload = workspace._process_file_payload(item, file_obj)
+
+    assert payload["path"] == "notebook-content.py"
+    assert base64.b64decode(payload["payload"]).decode("utf-8") == f'"workspaceId": "{valid_workspace_id}"'
+    assert file_obj.contents == original_content
+
+
+def test_process_file_payload_replaces_parameters_between_id_passes(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that parameters are replaced after logical IDs and before workspace IDs, as in separate passes."""
+    from fabric_cicd._common._file import File
+    from fabric_cicd._common._item import Item
+
+    parameter_content = """
+find_replace:
+    - find_value: "deployed-guid"
+      replace_value:
+        PPE: "ppe-guid"
+    - find_value: "placeholder"
+      replace_value:
+        PPE: "logical-id-2"
+"""
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+    item_path = temp_workspace_dir / "Test.Notebook"
+    file_path = item_path / "notebook-content.py"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(
+        'ref = "logical-id-1"\nother = "placeholder"\n"workspaceId": "00000000-0000-0000-0000-000000000000"',
+        encoding="utf-8",
+    )
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    workspace.repository_items = {
+        "Notebook": {
+            "Deployed": Item("Notebook", "Deployed", "", "deployed-guid", logical_id="logical-id-1"),
+            "Other": Item("Notebook", "Other", "", "other-guid", logical_id="logical-id-2"),
+        }
+    }
+    item = Item("Notebook", "Test", "", "", path=item_path)
+    payload = workspace._process_file_payload(item, File(item_path=item_path, file_path=file_path))
+
+    # Parameters match the deployed GUID, and logical IDs introduced by replace values are kept
+    assert base64.b64decode(payload["payload"]).decode("utf-8") == (
+        f'ref = "ppe-guid"\nother = "logical-id-2"\n"workspaceId": "{valid_workspace_id}"'
+    )
+
+
+def test_convert_lookups_use_item_indexes(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test id and path conversions resolve through the lazily built item lookups."""
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["DataPipeline", "SemanticModel"],
+        )
+
+    model_path = temp_workspace_dir / "Model.SemanticModel"
+    workspace.repository_items = {
+        "DataPipeline": {"Pipeline": Item("DataPipeline", "Pipeline", "", "", logical_id="pipeline-logical-id")},
+        "SemanticModel": {"Model": Item("SemanticModel", "Model", "", "", logical_id="model-id", path=model_path)},
+    }
+    workspace.deployed_items = {
+        "DataPipeline": {"Pipeline": Item("DataPipeline", "Pipeline", "", "pipeline-guid")},
+    }
+
+    assert workspace._convert_id_to_name("DataPipeline", "pipeline-logical-id", "Repository") == "Pipeline"
+    assert workspace._convert_id_to_name("DataPipeline", "pipeline-guid", "Deployed") == "Pipeline"
+    assert workspace._convert_id_to_name("DataPipeline", "unknown", "Repository") is None
+    assert workspace._convert_path_to_id("SemanticModel", str(model_path)) == "model-id"
+    assert workspace._convert_path_to_id("SemanticModel", str(temp_workspace_dir / "Other")) is None
+    assert workspace._convert_path_to_id("Report", str(model_path)) is None
+
+    # Refreshing the repository items rebuilds the lookups
+    with patch("fabric_cicd.fabric_workspace._iter_platform_dirs", return_value=iter([])):
+        workspace._refresh_repository_items()
+    assert workspace._convert_path_to_id("SemanticModel", str(model_path)) is None
+
+
 def test_empty_logical_id_validation_during_publish(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
     """Test that empty logical IDs are caught during workspace initialization."""
     from fabric_cicd._common._exceptions import ParsingError
@@ -1079,3 +1572,209 @@ def test_lookup_item_attribute(patched_fabric_workspace, valid_workspace_id, tem
         assert "target-workspace-id" in str(exc_info.value)
         assert "NonExistentType" in str(exc_info.value)
         assert "Test Item" in str(exc_info.value)
+
+
+def test_refresh_deployed_items_follows_continuation(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+    """Test that deployed items are collected from every page and item attributes are looked up."""
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook", "Lakehouse"],
+        )
+
+    items_url = f"{workspace.base_api_url}/items"
+    next_page_url = f"{items_url}?continuationToken=page2"
+
+    def mock_invoke(method, url, **_kwargs):
+        assert method == "GET"
+        if url == items_url:
+            notebook = {"type": "Notebook", "displayName": "Notebook1", "description": "", "id": "notebook-id"}
+            return {"body": {"value": [notebook], "continuationUri": next_page_url}}
+        if url == next_page_url:
+            lakehouse = {"type": "Lakehouse", "displayName": "Lakehouse1", "description": "", "id": "lakehouse-id"}
+            return {"body": {"value": [lakehouse]}}
+        if url.endswith("/lakehouses/lakehouse-id"):
+            return {"body": {"properties": {"sqlEndpointProperties": {"connectionString": "sql-endpoint"}}}}
+        msg = f"Unexpected URL {url}"
+        raise AssertionError(msg)
+
+    workspace.endpoint.invoke.side_effect = mock_invoke
+    workspace._refresh_deployed_items()
+
+    assert workspace.deployed_items["Notebook"]["Notebook1"].guid == "notebook-id"
+    assert workspace.deployed_items["Lakehouse"]["Lakehouse1"].guid == "lakehouse-id"
+    assert workspace.workspace_items["Lakehouse"]["Lakehouse1"]["sqlendpoint"] == "sql-endpoint"
+    assert workspace.workspace_items["Notebook"]["Notebook1"]["sqlendpoint"] == ""
+
+
+def test_refresh_deployed_items_replaces_dicts_when_complete(
+    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
+):
+    """Test that a refresh keeps the previous deployed items readable until the new ones are complete."""
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook", "Lakehouse"],
+        )
+
+    lakehouse = {"type": "Lakehouse", "displayName": "Lakehouse1", "description": "", "id": "lakehouse-id"}
+    notebooks = [
+        {"type": "Notebook", "displayName": f"Notebook{index}", "description": "", "id": f"notebook-id-{index}"}
+        for index in range(5)
+    ]
+    workspace.endpoint.invoke.return_value = {"body": {"value": [lakehouse, *notebooks]}}
+    attributes_patch = patch.object(FabricWorkspace, "_get_deployed_item_attributes", return_value=("", ""))
+    with attributes_patch:
+        workspace._refresh_deployed_items()
+    previous_deployed_items = workspace.deployed_items
+    previous_workspace_items = workspace.workspace_items
+
+    def _create_item(*args, **kwargs):
+        # Items published concurrently read the deployed items while a refresh builds new ones
+        assert workspace.deployed_items is previous_deployed_items
+        assert workspace.workspace_items is previous_workspace_items
+        assert "Lakehouse1" in workspace.workspace_items["Lakehouse"]
+        return Item(*args, **kwargs)
+
+    with attributes_patch, patch("fabric_cicd.fabric_workspace.Item", side_effect=_create_item):
+        workspace._refresh_deployed_items()
+
+    assert workspace.deployed_items is not previous_deployed_items
+    assert workspace.workspace_items["Lakehouse"]["Lakehouse1"]["id"] == "lakehouse-id"
+    assert len(workspace.deployed_items["Notebook"]) == 5
+
+
+@pytest.mark.parametrize("parallel", [False, True], ids=["serial", "parallel"])
+def test_publish_items(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id, monkeypatch, parallel):
+    """Test that every item of a type is published, serially by default and concurrently with the feature flags."""
+    from fabric_cicd._common._item import Item
+
+    if parallel:
+        monkeypatch.setattr(constants, "FEATURE_FLAG", {"enable_experimental_features", "enable_parallel_publish"})
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    item_names = [f"Notebook{index}" for index in range(20)]
+    workspace.repository_items = {"Notebook": {name: Item("Notebook", name, "", "") for name in item_names}}
+    workspace._logical_id_lookup = (None, {}, None)
+
+    with patch.object(workspace, "_publish_item") as mock_publish_item:
+        workspace._publish_items(item_type="Notebook", exclude_path=r".*\.pbi[/\\].*")
+
+    published = [call.kwargs["item_name"] for call in mock_publish_item.call_args_list]
+    assert sorted(published) == sorted(item_names)
+    assert all(call.kwargs["exclude_path"] == r".*\.pbi[/\\].*" for call in mock_publish_item.call_args_list)
+    if parallel:
+        # The logical ID lookup is rebuilt after concurrent publishes
+        assert workspace._logical_id_lookup is None
+
+
+def test_publish_items_parallel_stops_after_failure(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id, monkeypatch
+):
+    """Test that a failure while publishing concurrently is raised and no further items are published."""
+    from fabric_cicd._common._item import Item
+
+    monkeypatch.setattr(constants, "FEATURE_FLAG", {"enable_experimental_features", "enable_parallel_publish"})
+    # A single worker makes the publish order deterministic
+    monkeypatch.setattr(constants, "MAX_CONCURRENT_API_REQUESTS", 1)
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    item_names = ["A", "B", "C", "D"]
+    workspace.repository_items = {"Notebook": {name: Item("Notebook", name, "", "") for name in item_names}}
+    published = []
+
+    def _publish_item(item_name: str, item_type: str) -> None:
+        published.append(item_name)
+        if item_name == "B":
+            msg = f"Failed to publish {item_type} {item_name}"
+            raise ValueError(msg)
+
+    with (
+        patch.object(workspace, "_publish_item", side_effect=_publish_item),
+        pytest.raises(ValueError, match="Failed to publish Notebook B"),
+    ):
+        workspace._publish_items(item_type="Notebook")
+
+    assert published == ["A", "B"]
+
+
+@pytest.mark.parametrize(
+    ("attribute", "compiled_attribute"),
+    [
+        ("publish_item_name_exclude_regex", "_publish_item_name_exclude_re"),
+        ("publish_folder_path_exclude_regex", "_publish_folder_path_exclude_re"),
+    ],
+)
+def test_exclude_regex_setter_compiles_pattern(
+    attribute, compiled_attribute, temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that the exclude regex setters validate on assignment and cache the compiled pattern."""
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    assert getattr(workspace, attribute) is None
+    assert getattr(workspace, compiled_attribute) is None
+
+    setattr(workspace, attribute, "^legacy/.*")
+    assert getattr(workspace, attribute) == "^legacy/.*"
+    assert getattr(workspace, compiled_attribute).pattern == "^legacy/.*"
+    assert getattr(workspace, compiled_attribute).match("legacy/Item.Notebook")
+
+    # An invalid regex is reported when it is assigned, not when the first item is published
+    with pytest.raises(ValueError, match="An error occurred with the regex provided"):
+        setattr(workspace, attribute, "[unclosed")
+
+    setattr(workspace, attribute, None)
+    assert getattr(workspace, compiled_attribute) is None
+
+
+def test_publish_item_uses_cached_exclude_patterns(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test that publishing excludes items with the patterns compiled once by the setters."""
+    from fabric_cicd._common._check_utils import check_regex
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    workspace.repository_items = {
+        "Notebook": {
+            "Skip_Name": Item("Notebook", "Skip_Name", "", "", path=temp_workspace_dir / "Skip_Name.Notebook"),
+            "Legacy": Item("Notebook", "Legacy", "", "", path=temp_workspace_dir / "legacy" / "Legacy.Notebook"),
+        }
+    }
+
+    with patch("fabric_cicd.fabric_workspace.check_regex", wraps=check_regex) as mock_check_regex:
+        workspace.publish_item_name_exclude_regex = "^Skip_"
+        workspace.publish_folder_path_exclude_regex = "^legacy/"
+
+        workspace._publish_item(item_name="Skip_Name", item_type="Notebook")
+        workspace._publish_item(item_name="Legacy", item_type="Notebook")
+
+    assert mock_check_regex.call_count == 2
+    assert workspace.repository_items["Notebook"]["Skip_Name"].skip_publish
+    assert workspace.repository_items["Notebook"]["Legacy"].skip_publish
+    workspace.endpoint.invoke.assert_not_called()
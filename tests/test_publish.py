@@ -749,3 +749,60 @@ def test_legacy_folder_exclusion_example(mock_endpoint):
                 # Restore original feature flags
                 constants.FEATURE_FLAG.clear()
                 constants.FEATURE_FLAG.update(original_flags)
+
+
+def test_variable_library_activates_parameterized_value_set(mock_endpoint, caplog):
+    """Test that the active value set is chosen from the parameterized settings, as published."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        variable_library_dir = temp_path / "TestVariables.VariableLibrary"
+        variable_library_dir.mkdir(parents=True, exist_ok=True)
+
+        metadata = {
+            "metadata": {
+                "type": "VariableLibrary",
+                "displayName": "TestVariables",
+                "description": "Test variable library",
+            },
+            "config": {"logicalId": "test-variable-library-id"},
+        }
+        with (variable_library_dir / ".platform").open("w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+
+        with (variable_library_dir / "settings.json").open("w", encoding="utf-8") as f:
+            json.dump({"valueSetsOrder": ["Dev"]}, f)
+
+        (temp_path / "parameter.yml").write_text(
+            """
+find_replace:
+    - find_value: "Dev"
+      replace_value:
+        PROD: "PROD"
+      file_path: "TestVariables.VariableLibrary/settings.json"
+""",
+            encoding="utf-8",
+        )
+
+        with (
+            patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint),
+            patch.object(
+                FabricWorkspace, "_refresh_deployed_items", new=lambda self: setattr(self, "deployed_items", {})
+            ),
+            patch.object(
+                FabricWorkspace, "_refresh_deployed_folders", new=lambda self: setattr(self, "deployed_folders", {})
+            ),
+        ):
+            workspace = FabricWorkspace(
+                workspace_id="12345678-1234-5678-abcd-1234567890ab",
+                repository_directory=str(temp_path),
+                item_type_in_scope=["VariableLibrary"],
+                environment="PROD",
+            )
+
+            publish.publish_all_items(workspace)
+
+    activate_calls = [call for call in mock_endpoint.invoke.call_args_list if call.kwargs.get("method") == "PATCH"]
+    assert len(activate_calls) == 1
+    assert activate_calls[0].kwargs["body"] == {"properties": {"activeValueSetName": "PROD"}}
+    assert "does not match any value sets" not in caplog.text
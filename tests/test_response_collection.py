@@ -128,9 +128,8 @@ def test_publish_item_without_response_collection(test_workspace_with_notebook):
 
     # Patch the internal methods that process content to avoid mock issues
     with (
-        patch.object(workspace, "_replace_logical_ids", side_effect=lambda x: x),
-        patch.object(workspace, "_replace_parameters", side_effect=lambda file, _: file.contents),
-        patch.object(workspace, "_replace_workspace_ids", side_effect=lambda x: x),
+        patch.object(workspace, "_replace_parameters", side_effect=lambda _file, _item, raw_file: raw_file),
+        patch.object(workspace, "_replace_ids", side_effect=lambda x: x),
     ):
         workspace._publish_item(item_name="TestNotebook", item_type="Notebook")
         # Should not store any responses
@@ -150,9 +149,8 @@ def test_publish_item_with_response_collection(test_workspace_with_notebook):
         workspace.responses = {}  # Enable response collection
 
         with (
-            patch.object(workspace, "_replace_logical_ids", side_effect=lambda x: x),
-            patch.object(workspace, "_replace_parameters", side_effect=lambda file, _: file.contents),
-            patch.object(workspace, "_replace_workspace_ids", side_effect=lambda x: x),
+            patch.object(workspace, "_replace_parameters", side_effect=lambda _file, _item, raw_file: raw_file),
+            patch.object(workspace, "_replace_ids", side_effect=lambda x: x),
         ):
             workspace._publish_item(item_name="TestNotebook", item_type="Notebook")
 